@@ -10,13 +10,31 @@ processes them, and calculates average ratings for:
 - Movies Owen Wilson starred in alone
 """
 
+import math
 import os
+import shutil
+import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Optional, cast
+from typing import IO, Any, Callable, Iterator, List, Optional, Union, cast
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 import requests
+from numpy.typing import NDArray
+from pyarrow import csv
+
+try:
+    from isal import igzip
+except ImportError:  # pragma: no cover - optional accelerator
+    igzip = None
 
 # IMDB dataset URLs
 IMDB_BASE_URL = "https://datasets.imdbws.com/"
@@ -27,116 +45,467 @@ DATASETS = {
     "title.ratings": "title.ratings.tsv.gz",
 }
 
+# Number of parallel byte-range requests per download
+DOWNLOAD_SEGMENTS = 8
+
+# Bytes read from the socket per write, and percent between progress lines
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+PROGRESS_STEP = 10
+
+# Serialises progress output from concurrent downloads
+_OUTPUT_LOCK = threading.Lock()
+
+# Rows per row group in the Parquet cache files
+PARQUET_ROW_GROUP_SIZE = 1_000_000
+
+# Column types for each dataset. IDs and names load as Arrow-backed strings
+# (pd.ArrowDtype) rather than Python objects; low-cardinality labels are
+# dictionary-encoded (loaded as pandas categoricals).
+SCHEMAS = {
+    "name.basics": pa.schema(
+        [
+            ("nconst", pa.string()),
+            ("primaryName", pa.string()),
+            ("primaryProfession", pa.string()),
+        ]
+    ),
+    "title.basics": pa.schema(
+        [
+            ("tconst", pa.string()),
+            ("titleType", pa.dictionary(pa.int32(), pa.string())),
+            ("primaryTitle", pa.string()),
+        ]
+    ),
+    "title.principals": pa.schema(
+        [
+            ("tconst", pa.string()),
+            ("nconst", pa.string()),
+            ("category", pa.dictionary(pa.int32(), pa.string())),
+        ]
+    ),
+    "title.ratings": pa.schema(
+        [
+            ("tconst", pa.string()),
+            ("averageRating", pa.float32()),
+            ("numVotes", pa.int32()),
+        ]
+    ),
+}
+
 # Actors to compare
 ACTOR_1 = "Bill Murray"
 ACTOR_2 = "Owen Wilson"
 
 
-def download_file(url: str, dest_path: Path) -> None:
-    """Download a file from URL to destination path."""
-    print(f"Downloading {url}...")
-    response = requests.get(url, stream=True, timeout=300)
-    response.raise_for_status()
+def _fetch_range(
+    url: str,
+    dest_path: Path,
+    start: int,
+    end: int,
+    on_chunk: Callable[[int], None],
+) -> None:
+    """Download bytes ``start``-``end`` (inclusive) into ``dest_path``."""
+    headers = {"Range": f"bytes={start}-{end}"}
+    with requests.get(
+        url, headers=headers, stream=True, timeout=300
+    ) as response:
+        response.raise_for_status()
+        if response.status_code != 206:
+            raise RuntimeError(f"Server ignored range request for {url}")
+        content_range = response.headers.get("content-range", "")
+        if not content_range.startswith(f"bytes {start}-{end}/"):
+            raise RuntimeError(
+                f"Expected bytes {start}-{end} from {url}, "
+                f"got Content-Range {content_range!r}"
+            )
+        written = 0
+        with open(dest_path, "r+b") as f:
+            f.seek(start)
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
+                written += len(chunk)
+                on_chunk(len(chunk))
+    if written != end - start + 1:
+        raise RuntimeError(
+            f"Expected {end - start + 1} bytes from {url}, got {written}"
+        )
+
+
+def download_file(  # pylint: disable=too-many-locals
+    url: str, dest_path: Path
+) -> None:
+    """Download a file from URL to destination path.
+
+    Servers that accept byte ranges are fetched in ``DOWNLOAD_SEGMENTS``
+    parallel pieces written straight into a preallocated file. The data
+    lands in a ``.part`` file that is renamed only once complete.
+    """
+    with _OUTPUT_LOCK:
+        sys.stdout.write(f"Downloading {url}...\n")
+    head = requests.head(url, allow_redirects=True, timeout=60)
+    head.raise_for_status()
 
-    total_size = int(response.headers.get("content-length", 0))
+    total_size = int(head.headers.get("content-length", 0))
     downloaded = 0
+    next_pct = PROGRESS_STEP
+    # Byte count at which next_pct is reached; never reached if unknown
+    next_report_at = total_size * next_pct / 100 if total_size else math.inf
+    lock = threading.Lock()
+
+    def on_chunk(size: int) -> None:
+        nonlocal downloaded, next_pct, next_report_at
+        with lock:
+            downloaded += size
+            if downloaded < next_report_at:
+                return
+            pct = min(100, downloaded * 100 // total_size)
+            # Concurrent downloads share stdout; write each line whole
+            with _OUTPUT_LOCK:
+                sys.stdout.write(f"  {dest_path.name}: {pct}%\n")
+                sys.stdout.flush()
+            next_pct = (pct // PROGRESS_STEP + 1) * PROGRESS_STEP
+            next_report_at = total_size * next_pct / 100
+
+    part_path = dest_path.with_name(dest_path.name + ".part")
+    if total_size and head.headers.get("accept-ranges") == "bytes":
+        with open(part_path, "wb") as f:
+            f.truncate(total_size)
+        step = -(-total_size // DOWNLOAD_SEGMENTS)
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_SEGMENTS) as pool:
+            futures = [
+                pool.submit(
+                    _fetch_range,
+                    url,
+                    part_path,
+                    start,
+                    min(start + step, total_size) - 1,
+                    on_chunk,
+                )
+                for start in range(0, total_size, step)
+            ]
+            for future in futures:
+                future.result()
+    else:
+        with requests.get(url, stream=True, timeout=300) as response:
+            response.raise_for_status()
+            with open(part_path, "wb") as f:
+                for chunk in response.iter_content(
+                    chunk_size=DOWNLOAD_CHUNK_SIZE
+                ):
+                    f.write(chunk)
+                    on_chunk(len(chunk))
 
-    with open(dest_path, "wb") as f:
-        for chunk in response.iter_content(chunk_size=8192):
-            f.write(chunk)
-            downloaded += len(chunk)
-            if total_size:
-                pct = (downloaded / total_size) * 100
-                print(f"\r  Progress: {pct:.1f}%", end="", flush=True)
-    print()
+    part_path.replace(dest_path)
 
 
 def ensure_datasets(data_dir: Path) -> dict[str, Path]:
-    """Ensure all required datasets are downloaded."""
+    """Ensure all required datasets are downloaded.
+
+    Missing files are downloaded concurrently.
+    """
     data_dir.mkdir(parents=True, exist_ok=True)
     paths = {}
+    missing = []
 
     for name, filename in DATASETS.items():
         file_path = data_dir / filename
         if not file_path.exists():
-            download_file(IMDB_BASE_URL + filename, file_path)
+            missing.append(file_path)
         else:
             print(f"Using cached: {filename}")
         paths[name] = file_path
 
+    if missing:
+        with ThreadPoolExecutor(max_workers=len(missing)) as pool:
+            futures = [
+                pool.submit(download_file, IMDB_BASE_URL + path.name, path)
+                for path in missing
+            ]
+            for future in futures:
+                future.result()
+
+    for file_path in paths.values():
+        parquet_path = _parquet_path(file_path)
+        if (
+            not parquet_path.exists()
+            or parquet_path.stat().st_mtime < file_path.stat().st_mtime
+            or pq.read_schema(parquet_path).remove_metadata()
+            != SCHEMAS[_dataset_name(file_path)]
+        ):
+            cache_as_parquet(file_path, parquet_path)
+
     return paths
 
 
+@contextmanager
+def _open_gz(path: Path) -> Iterator[Union[IO[bytes], pa.NativeFile]]:
+    """Open a gzip file for reading, using the fastest available inflater.
+
+    Prefers a ``pigz`` subprocess (multi-core), then ISA-L's ``igzip``,
+    then Arrow's built-in zlib stream.
+    """
+    pigz = shutil.which("pigz")
+    if pigz:
+        with subprocess.Popen(
+            [pigz, "-cd", str(path)], stdout=subprocess.PIPE
+        ) as proc:
+            assert proc.stdout is not None
+            yield proc.stdout
+        if proc.returncode:
+            raise subprocess.CalledProcessError(proc.returncode, proc.args)
+    elif igzip is not None:
+        with igzip.open(path, "rb") as f:
+            yield f
+    else:
+        with pa.input_stream(str(path), compression="gzip") as f:
+            yield f
+
+
+def _pandas_type(arrow_type: pa.DataType) -> Optional[pd.ArrowDtype]:
+    """Map Arrow types to ArrowDtype, leaving dictionaries as categoricals."""
+    if pa.types.is_dictionary(arrow_type):
+        return None
+    return pd.ArrowDtype(arrow_type)
+
+
+def _dataset_name(path: Path) -> str:
+    """Return the dataset name (key of ``DATASETS``) for a file path."""
+    return path.name.removesuffix(".tsv.gz").removesuffix(".parquet")
+
+
+def _parquet_path(path: Path) -> Path:
+    """Return the Parquet cache path that sits next to a ``.tsv.gz``."""
+    return path.with_name(_dataset_name(path) + ".parquet")
+
+
+def _csv_options(
+    schema: pa.Schema, usecols: Optional[List[str]] = None
+) -> dict[str, Any]:
+    """Build the PyArrow CSV reader options for an IMDB TSV file."""
+    return {
+        "read_options": csv.ReadOptions(use_threads=True, block_size=8 << 20),
+        # IMDB TSVs are unquoted; titles may contain literal quotes
+        "parse_options": csv.ParseOptions(delimiter="\t", quote_char=False),
+        "convert_options": csv.ConvertOptions(
+            null_values=["\\N"],
+            include_columns=usecols or schema.names,
+            column_types=schema,
+        ),
+    }
+
+
+def cache_as_parquet(path: Path, parquet_path: Path) -> None:
+    """Convert a gzipped TSV into a typed, zstd-compressed Parquet file.
+
+    Batches are streamed from the CSV reader into the Parquet writer, so
+    the full dataset is never held in memory.
+    """
+    print(f"Caching {path.name} as {parquet_path.name}...")
+    part_path = parquet_path.with_name(parquet_path.name + ".part")
+    schema = SCHEMAS[_dataset_name(path)]
+    with _open_gz(path) as src:
+        reader = csv.open_csv(src, **_csv_options(schema))
+        with pq.ParquetWriter(
+            part_path, reader.schema, compression="zstd"
+        ) as writer:
+            pending: list[pa.RecordBatch] = []
+            pending_rows = 0
+            for batch in reader:
+                pending.append(batch)
+                pending_rows += batch.num_rows
+                if pending_rows >= PARQUET_ROW_GROUP_SIZE:
+                    writer.write_table(pa.Table.from_batches(pending))
+                    pending, pending_rows = [], 0
+            if pending:
+                writer.write_table(pa.Table.from_batches(pending))
+    part_path.replace(parquet_path)
+
+
 def load_tsv_gz(
-    path: Path, usecols: Optional[List[str]] = None
+    path: Path,
+    usecols: Optional[List[str]] = None,
+    row_filter: Optional[pc.Expression] = None,
 ) -> pd.DataFrame:
-    """Load a gzipped TSV file into a DataFrame."""
+    """Load a gzipped TSV file into a DataFrame.
+
+    Reads the Parquet cache written by ``cache_as_parquet`` when present.
+    When ``row_filter`` is given only matching rows are kept; the TSV is
+    then streamed in batches so discarded rows never accumulate in memory.
+    """
+    parquet_path = _parquet_path(path)
+    if parquet_path.exists():
+        print(f"Loading {parquet_path.name}...")
+        # Memory-map the file so column buffers are backed by the page
+        # cache, and release Arrow memory as each column is converted
+        table = pq.read_table(
+            parquet_path,
+            columns=usecols,
+            filters=row_filter,
+            memory_map=True,
+        )
+        cached: pd.DataFrame = table.to_pandas(
+            types_mapper=_pandas_type, self_destruct=True, split_blocks=True
+        )
+        return cached
+
     print(f"Loading {path.name}...")
-    return pd.read_csv(
-        path,
-        sep="\t",
-        na_values="\\N",
-        usecols=usecols,
-        low_memory=False,
-        dtype=str,
+    schema = SCHEMAS[_dataset_name(path)]
+    with _open_gz(path) as src:
+        if row_filter is None:
+            table = csv.read_csv(src, **_csv_options(schema, usecols))
+        else:
+            # Read every schema column so the filter may reference columns
+            # outside usecols. The scanner binds the filter once, so set
+            # lookups such as is_in build their hash table once rather
+            # than per batch.
+            table = ds.Scanner.from_batches(
+                csv.open_csv(src, **_csv_options(schema)),
+                columns=usecols,
+                filter=row_filter,
+            ).to_table()
+    df: pd.DataFrame = table.to_pandas(types_mapper=_pandas_type)
+    return df
+
+
+def encode_tconst(
+    values: pd.Series,
+    dictionary: Union[pa.Array, pa.ChunkedArray],
+    dtype: pd.CategoricalDtype,
+) -> pd.Series:
+    """Encode title IDs as codes into a shared ``tconst`` dictionary.
+
+    ``dtype`` must have ``dictionary`` as its categories. Codes come from
+    Arrow's ``index_in`` on the raw string buffers; unknown IDs become NaN.
+    """
+    codes = pc.index_in(pa.array(values), value_set=dictionary)
+    encoded: pd.Series = pd.Series(
+        pd.Categorical.from_codes(codes.fill_null(-1).to_numpy(), dtype=dtype),
+        index=values.index,
     )
+    return encoded
 
 
-def find_actor_nconst(name_basics: pd.DataFrame, actor_name: str) -> str:
-    """Find the nconst (IMDB ID) for an actor by name."""
-    matches = name_basics[name_basics["primaryName"] == actor_name]
+def has_profession(professions: pd.Series, wanted: List[str]) -> pd.Series:
+    """Flag rows whose comma-separated professions include any of ``wanted``.
+
+    Splits and matches whole tokens on the Arrow buffers, avoiding a regex
+    scan; missing professions never match.
+    """
+    values = pa.array(professions)
+    if isinstance(values, pa.ChunkedArray):
+        values = values.combine_chunks()
+    lists = pc.split_pattern(values, ",")
+    hits = pc.is_in(pc.list_flatten(lists), value_set=pa.array(wanted))
+    rows = pc.list_parent_indices(lists).filter(hits)
+    mask = np.zeros(len(professions), dtype=bool)
+    mask[rows.to_numpy()] = True
+    return pd.Series(mask, index=professions.index)
+
+
+def index_actors(name_basics: pd.DataFrame) -> pd.DataFrame:
+    """Keep actors/actresses and index them by unique ``primaryName``.
+
+    Only the first row for each name is kept (usually the most prominent),
+    so the index is unique and lookups are hash probes.
+    """
+    is_actor = has_profession(
+        name_basics["primaryProfession"], ["actor", "actress"]
+    )
+    return cast(
+        pd.DataFrame,
+        name_basics.loc[is_actor, ["nconst", "primaryName"]]
+        .drop_duplicates("primaryName", keep="first")
+        .set_index("primaryName"),
+    )
 
-    if matches.empty:
-        raise ValueError(f"Actor '{actor_name}' not found in database")
 
-    if len(matches) > 1:
-        # Filter for actors/actresses if multiple matches
-        actor_matches = matches[
-            matches["primaryProfession"].str.contains(
-                "actor|actress", na=False
-            )
-        ]
-        if not actor_matches.empty:
-            matches = actor_matches
+def find_actor_nconst(actors: pd.DataFrame, actor_name: str) -> str:
+    """Find the nconst (IMDB ID) for an actor by name.
 
-    # Return the first match (usually the most prominent)
-    nconst: str = str(matches.iloc[0]["nconst"])
+    ``actors`` is the name-indexed frame built by ``index_actors``.
+    """
+    try:
+        nconst: str = str(actors.at[actor_name, "nconst"])
+    except KeyError as exc:
+        raise ValueError(
+            f"Actor '{actor_name}' not found in database"
+        ) from exc
     print(f"Found {actor_name}: {nconst}")
     return nconst
 
 
-def get_actor_titles(principals: pd.DataFrame, nconst: str) -> set[str]:
-    """Get all title IDs (tconst) for an actor."""
-    actor_titles = principals[principals["nconst"] == nconst]["tconst"]
-    return set(actor_titles)
+def build_actor_index(
+    principals: pd.DataFrame, nconsts: List[str]
+) -> dict[str, NDArray[np.int32]]:
+    """Map each requested actor's nconst to their title codes in one pass.
+
+    Titles are the sorted, unique ``tconst`` category codes, ready for
+    ``np.intersect1d``/``np.setdiff1d``.
+    """
+    rows = principals.loc[principals["nconst"].isin(nconsts)]
+    codes = rows["tconst"].cat.codes.astype(np.int32)
+    return {
+        str(nconst): np.unique(group.to_numpy())
+        for nconst, group in codes.groupby(rows["nconst"], sort=False)
+    }
+
+
+def get_actor_titles(
+    actor_index: dict[str, NDArray[np.int32]], nconst: str
+) -> NDArray[np.int32]:
+    """Get the sorted title codes (tconst) for an actor."""
+    return actor_index.get(nconst, np.empty(0, dtype=np.int32))
 
 
-def calculate_average_rating(
-    tconsts: set[str], ratings: pd.DataFrame, title_basics: pd.DataFrame
-) -> tuple[float, int, list[str]]:
-    """Calculate average rating for a set of titles.
+def calculate_average_ratings(
+    groups: dict[str, NDArray[np.int32]], ratings: pd.DataFrame
+) -> dict[str, tuple[float, int]]:
+    """Calculate average ratings for disjoint groups of titles.
+
+    Groups hold ``tconst`` category codes matching ``ratings``. All groups
+    are labelled in one frame, joined against ``ratings`` once, and
+    aggregated with a single groupby.
 
     Returns:
-        Tuple of (average_rating, count, title_names).
+        Mapping of group label to (average_rating, count).
     """
-    if not tconsts:
-        return 0.0, 0, []
+    labels = pd.DataFrame(
+        {
+            "tconst": pd.Categorical.from_codes(
+                np.concatenate(list(groups.values())),
+                dtype=cast(pd.CategoricalDtype, ratings["tconst"].dtype),
+            ),
+            "group": np.repeat(
+                list(groups), [len(codes) for codes in groups.values()]
+            ),
+        }
+    )
 
-    # Filter ratings for the given titles
-    filtered = ratings[ratings["tconst"].isin(tconsts)].copy()
-    filtered["averageRating"] = pd.to_numeric(
-        filtered["averageRating"], errors="coerce"
+    # Join ratings against the labelled titles and aggregate per group;
+    # count skips missing ratings
+    stats = (
+        ratings.merge(labels, on="tconst")
+        .groupby("group")["averageRating"]
+        .agg(["mean", "count"])
     )
 
-    # Get title names for display
-    titles_df = title_basics[title_basics["tconst"].isin(tconsts)]
-    title_names = titles_df["primaryTitle"].tolist()
+    results = {}
+    for label in groups:
+        count = int(stats["count"].get(label, 0))
+        if not count:
+            results[label] = (0.0, 0)
+        else:
+            results[label] = (float(stats.at[label, "mean"]), count)
+    return results
 
-    valid_ratings = filtered["averageRating"].dropna()
-    if valid_ratings.empty:
-        return 0.0, 0, title_names
 
-    return valid_ratings.mean(), len(valid_ratings), title_names
+def get_title_names(
+    tconsts: NDArray[np.int32], title_basics: pd.DataFrame
+) -> list[str]:
+    """Get the primary titles for a set of ``tconst`` category codes."""
+    matches = np.isin(title_basics["tconst"].cat.codes, tconsts)
+    names: list[str] = title_basics.loc[matches, "primaryTitle"].tolist()
+    return names
 
 
 def main() -> int:  # pylint: disable=too-many-locals,too-many-statements
@@ -159,57 +528,80 @@ def main() -> int:  # pylint: disable=too-many-locals,too-many-statements
     print("Step 2: Loading datasets")
     print("-" * 40)
 
-    name_basics = load_tsv_gz(
-        paths["name.basics"],
-        usecols=["nconst", "primaryName", "primaryProfession"],
-    )
-
-    title_basics = load_tsv_gz(
-        paths["title.basics"], usecols=["tconst", "primaryTitle", "titleType"]
-    )
-
-    # Filter to movies only
-    title_basics = cast(
-        pd.DataFrame,
-        title_basics.loc[title_basics["titleType"] == "movie"].copy(),
-    )
-    movie_tconsts = set(title_basics["tconst"])
-
-    principals = load_tsv_gz(
-        paths["title.principals"], usecols=["tconst", "nconst", "category"]
-    )
-
-    # Filter principals to actors/actresses in movies
-    principals = cast(
-        pd.DataFrame,
-        principals.loc[
-            (principals["category"].isin(["actor", "actress"]))
-            & (principals["tconst"].isin(movie_tconsts))
-        ].copy(),
-    )
-
-    ratings = load_tsv_gz(
-        paths["title.ratings"], usecols=["tconst", "averageRating", "numVotes"]
-    )
+    # name.basics is independent of the title tables, so parse it on a
+    # worker thread while the title pipeline runs
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        actors_future = pool.submit(
+            lambda: index_actors(
+                load_tsv_gz(
+                    paths["name.basics"],
+                    usecols=["nconst", "primaryName", "primaryProfession"],
+                )
+            )
+        )
+
+        # Stream title.basics, keeping movies only
+        title_basics = load_tsv_gz(
+            paths["title.basics"],
+            usecols=["tconst", "primaryTitle"],
+            row_filter=pc.field("titleType") == "movie",
+        )
+
+        # One tconst dictionary (the movie list) is shared by every table,
+        # so joins and set operations compare int32 codes
+        movie_tconsts = pa.array(title_basics["tconst"])
+        movie_ids = pd.CategoricalDtype(title_basics["tconst"])
+        title_basics["tconst"] = encode_tconst(
+            title_basics["tconst"], movie_tconsts, movie_ids
+        )
+        is_movie = pc.field("tconst").isin(movie_tconsts)
+
+        # Ratings and principals both only need movie rows; read them
+        # concurrently with that predicate pushed into the scan
+        ratings_future = pool.submit(
+            load_tsv_gz,
+            paths["title.ratings"],
+            usecols=["tconst", "averageRating", "numVotes"],
+            row_filter=is_movie,
+        )
+
+        # Stream principals, keeping only actors/actresses in movies
+        principals = load_tsv_gz(
+            paths["title.principals"],
+            usecols=["tconst", "nconst", "category"],
+            row_filter=(
+                pc.field("category").isin(["actor", "actress"]) & is_movie
+            ),
+        )
+        principals["tconst"] = encode_tconst(
+            principals["tconst"], movie_tconsts, movie_ids
+        )
+
+        ratings = ratings_future.result()
+        ratings["tconst"] = encode_tconst(
+            ratings["tconst"], movie_tconsts, movie_ids
+        )
+        actors = actors_future.result()
     print()
 
     # Find actors
     print("Step 3: Finding actors")
     print("-" * 40)
-    nconst_1 = find_actor_nconst(name_basics, ACTOR_1)
-    nconst_2 = find_actor_nconst(name_basics, ACTOR_2)
+    nconst_1 = find_actor_nconst(actors, ACTOR_1)
+    nconst_2 = find_actor_nconst(actors, ACTOR_2)
     print()
 
     # Get their movies
     print("Step 4: Analyzing filmographies")
     print("-" * 40)
-    titles_1 = get_actor_titles(principals, nconst_1)
-    titles_2 = get_actor_titles(principals, nconst_2)
+    actor_index = build_actor_index(principals, [nconst_1, nconst_2])
+    titles_1 = get_actor_titles(actor_index, nconst_1)
+    titles_2 = get_actor_titles(actor_index, nconst_2)
 
-    # Compute sets
-    both = titles_1 & titles_2
-    only_1 = titles_1 - both
-    only_2 = titles_2 - both
+    # Set operations on the sorted, unique title codes
+    both = np.intersect1d(titles_1, titles_2, assume_unique=True)
+    only_1 = np.setdiff1d(titles_1, both, assume_unique=True)
+    only_2 = np.setdiff1d(titles_2, both, assume_unique=True)
 
     print(f"{ACTOR_1} movies: {len(titles_1)}")
     print(f"{ACTOR_2} movies: {len(titles_2)}")
@@ -220,11 +612,13 @@ def main() -> int:  # pylint: disable=too-many-locals,too-many-statements
     print("Step 5: Calculating average ratings")
     print("-" * 40)
 
-    avg_both, count_both, titles_both = calculate_average_rating(
-        both, ratings, title_basics
+    results = calculate_average_ratings(
+        {"both": both, "only_1": only_1, "only_2": only_2}, ratings
     )
-    avg_1, count_1, _ = calculate_average_rating(only_1, ratings, title_basics)
-    avg_2, count_2, _ = calculate_average_rating(only_2, ratings, title_basics)
+    avg_both, count_both = results["both"]
+    avg_1, count_1 = results["only_1"]
+    avg_2, count_2 = results["only_2"]
+    titles_both = get_title_names(both, title_basics)
     print()
 
     # Print results